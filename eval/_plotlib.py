@@ -0,0 +1,118 @@
+"""Shared matplotlib helpers for the eval plotting scripts.
+
+Importing this module selects the Agg backend and warms up the font
+lookup once, so a driver that renders several figures in one process
+pays the matplotlib startup cost a single time. The individual
+plot_result.py scripts stay runnable on their own.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")  # Headless raster backend; avoids GUI backend probing
+import matplotlib.font_manager
+import matplotlib.pyplot as plt  # noqa: F401  (re-exported for the scripts)
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The first font lookup builds/loads the font cache; doing it at import
+# time front-loads that cost for every figure rendered afterwards
+matplotlib.font_manager.fontManager.findfont("DejaVu Sans")
+
+# Chunk large paths so Agg does not choke on long line series
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Default grouped-bar geometry shared by the bar-chart scripts
+BAR_WIDTH = 0.35
+BAR_GAP = 0.05
+
+# Above this size, hand the file to the streaming stdlib parser instead of
+# slurping it, to keep peak memory bounded; eval results are far below this
+_READ_WHOLE_LIMIT = 200 * 1024 * 1024
+
+
+def load_json(path):
+    """Parse a result JSON file with one whole-file read.
+
+    Reading the bytes up front and parsing in memory beats incremental
+    parsing at these file sizes, and orjson (when installed) parses in
+    native code, several times faster than stdlib json.
+    """
+    path = Path(path)
+    if path.stat().st_size > _READ_WHOLE_LIMIT:
+        with path.open("rb") as f:
+            return json.load(f)
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+@lru_cache(maxsize=None)
+def _group_offsets(n, width, gap):
+    """Centered bar offsets for an n-series group.
+
+    The scripts only ever use a couple of (n, width, gap) shapes, so the
+    offsets are effectively module constants computed once per process.
+    """
+    return (np.arange(n) - (n - 1) / 2) * (width + gap)
+
+
+def make_grouped_bar(ax, x, series, labels, colors, hatches,
+                     width=BAR_WIDTH, gap=BAR_GAP, linewidth=1.5, **bar_kwargs):
+    """Draw one white-faced hatched bar group per series.
+
+    `series` is one value sequence per label, aligned with `x` (a 2D
+    ndarray works as-is). Bars are rasterized so the hatch patterns render
+    straight into the PNG raster instead of as per-stroke vector paths.
+    """
+    x = np.asarray(x)
+    series = np.asarray(series, dtype=np.float64)
+    # All group offsets come from one cached broadcast instead of
+    # per-iteration arithmetic; hatches are not vectorizable, so one bar
+    # call per series remains, each handed pre-computed positions
+    positions = x[None, :] + _group_offsets(len(labels), width, gap)[:, None]
+    for pos, vals, label, color, hatch in zip(positions, series, labels, colors, hatches):
+        ax.bar(pos, vals, width, label=label,
+               color='white', edgecolor=color, hatch=hatch,
+               linewidth=linewidth, rasterized=True, **bar_kwargs)
+
+
+def finalize(ax, title, ylabel, *, title_fontsize=20, ylabel_fontsize=16,
+             tick_fontsize=14, legend_fontsize=14, legend_ncol=2,
+             title_y=-0.25, legend_y=1.05):
+    """Apply the shared axis styling: horizontal grid, open top/right
+    spines, bold title below the axes and a frameless legend above."""
+    ax.set_ylabel(ylabel, fontsize=ylabel_fontsize)
+    ax.tick_params(axis='y', labelsize=tick_fontsize)
+
+    ax.yaxis.grid(True, linestyle='-', alpha=0.3)
+    ax.set_axisbelow(True)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    ax.text(0.5, title_y, title, transform=ax.transAxes,
+            fontsize=title_fontsize, fontweight='bold', ha='center')
+    ax.legend(loc='upper center', bbox_to_anchor=(0.5, legend_y),
+              ncol=legend_ncol, frameon=False, fontsize=legend_fontsize,
+              handletextpad=0.3, columnspacing=0.8)
+
+
+def save_fig(fig, path, dpi=300):
+    """Save the figure at its own size in a single render.
+
+    Callers reserve room for out-of-axes artists (bottom titles, floating
+    legends) through their layout engine's rect, so no bounding-box
+    measurement pass is needed here at all. PNGs are encoded at zlib
+    level 1; the default level 6 dominates savefig time and buys little
+    on chart-like images. Non-PNG suffixes (e.g. .pdf) dispatch to the
+    matching backend unchanged.
+    """
+    if str(path).endswith('.png'):
+        fig.savefig(path, dpi=dpi, pil_kwargs={'compress_level': 1})
+    else:
+        fig.savefig(path, dpi=dpi)
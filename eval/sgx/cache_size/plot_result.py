@@ -1,4 +1,7 @@
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Headless raster backend; avoids GUI backend probing
 import matplotlib.pyplot as plt
 import os
 
@@ -11,25 +14,33 @@ if not os.path.exists(file_path):
 
 df = pd.read_csv(file_path)
 
-# Separate data by disk type
-sworn_data = df[df['disk_type'] == 'sworndisk'].copy()
-crypt_data = df[df['disk_type'] == 'cryptdisk'].copy()
+# Separate data by disk type and extract each plotted series as a float64
+# NumPy array once, pre-sorted along the X axis, instead of handing pandas
+# Series to every plot call below.
+# We use logical_gb for X-axis to align with 10-90% ticks perfectly.
+def sorted_series(sub, column):
+    x = sub['logical_gb'].to_numpy(dtype=np.float64)
+    order = np.argsort(x)
+    return x[order], sub[column].to_numpy(dtype=np.float64)[order]
 
-# Ensure numeric types
-# We use logical_gb for X-axis to align with 10-90% ticks perfectly
-sworn_data['logical_gb'] = pd.to_numeric(sworn_data['logical_gb']) 
-crypt_data['logical_gb'] = pd.to_numeric(crypt_data['logical_gb'])
+sworn_data = df[df['disk_type'] == 'sworndisk']
+crypt_data = df[df['disk_type'] == 'cryptdisk']
 
-sworn_data['throughput_mib_s'] = pd.to_numeric(sworn_data['throughput_mib_s'])
-sworn_data['waf'] = pd.to_numeric(sworn_data['waf'])
-crypt_data['throughput_mib_s'] = pd.to_numeric(crypt_data['throughput_mib_s'])
+sworn_x, sworn_waf = sorted_series(sworn_data, 'waf')
+_, sworn_tput = sorted_series(sworn_data, 'throughput_mib_s')
+crypt_x, crypt_tput = sorted_series(crypt_data, 'throughput_mib_s')
 
-# As per your instruction: CryptDisk WAF is fixed at 1.0
-crypt_waf_fixed = [1.0] * len(crypt_data)
+# As per your instruction: CryptDisk WAF is fixed at 1.0; build the
+# ndarray directly so matplotlib skips the list-to-array conversion
+crypt_waf_fixed = np.full(len(crypt_x), 1.0)
 
 # 2. Plotting Configuration
 plt.rcParams['font.family'] = 'sans-serif'
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+# constrained_layout solves the layout once during draw instead of a
+# separate manual-adjustment pass; the rect reserves margins for the
+# bottom titles and the legends floating above the axes
+fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5), constrained_layout=True)
+fig.get_layout_engine().set(rect=(0, 0.10, 1, 0.85))
 
 # Style constants
 marker_size = 6
@@ -40,10 +51,10 @@ sworn_color = '#3b75af' # Blue
 # === Plot (a) Write Amplification Factor ===
 # 使用 logical_gb 作为 X 轴，确保点对齐到 10, 20... 90
 # StrataDisk (Blue Triangle)
-ax1.plot(sworn_data['logical_gb'], sworn_data['waf'],
+ax1.plot(sworn_x, sworn_waf,
          label='StrataDisk', color=sworn_color, marker='^', markersize=marker_size, linewidth=line_width)
 # CryptDisk (Red Circle)
-ax1.plot(crypt_data['logical_gb'], crypt_waf_fixed,
+ax1.plot(crypt_x, crypt_waf_fixed,
          label='CryptDisk', color=crypt_color, marker='o', markersize=marker_size, linewidth=line_width)
 
 ax1.set_ylabel('Write Amp. Factor', fontsize=14, fontweight='bold')
@@ -52,10 +63,10 @@ ax1.set_yticks([0.90, 0.95, 1.00, 1.05, 1.10, 1.15])
 
 # === Plot (b) Throughput ===
 # StrataDisk (Blue Triangle)
-ax2.plot(sworn_data['logical_gb'], sworn_data['throughput_mib_s'],
+ax2.plot(sworn_x, sworn_tput,
          label='StrataDisk', color=sworn_color, marker='^', markersize=marker_size, linewidth=line_width)
 # CryptDisk (Red Circle)
-ax2.plot(crypt_data['logical_gb'], crypt_data['throughput_mib_s'],
+ax2.plot(crypt_x, crypt_tput,
          label='CryptDisk', color=crypt_color, marker='o', markersize=marker_size, linewidth=line_width)
 
 ax2.set_ylabel('Throughput (MB/s)', fontsize=14, fontweight='bold')
@@ -86,10 +97,8 @@ for ax, title in zip([ax1, ax2], ['(a) Write amplification factor', '(b) Through
     ax.text(0.5, -0.3, title, transform=ax.transAxes, fontsize=16,
             ha='center', va='center', fontweight='bold')
 
-# Adjust layout to make room for labels and legends
-plt.subplots_adjust(top=0.8, bottom=0.25, wspace=0.3)
-
-# 3. Save the result
+# 3. Save the result in a single render; the layout rect above already
+# reserves room for the out-of-axes titles and legends
 output_filename = 'result.png'
-plt.savefig(output_filename, dpi=300, bbox_inches='tight')
+fig.savefig(output_filename, dpi=300)
 print(f"Chart successfully saved as: {os.path.abspath(output_filename)}")
\ No newline at end of file
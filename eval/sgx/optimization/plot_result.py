@@ -15,11 +15,14 @@ except FileNotFoundError:
     data = []
 
 # 2. Extract values dynamically based on labels
-# We use next() with a generator to find the specific entry for each category
-write_base = next(d['throughput_mib_s'] for d in data if d['type'] == 'write' and not d['delayed_reclamation'])
-write_opt  = next(d['throughput_mib_s'] for d in data if d['type'] == 'write' and d['delayed_reclamation'])
-read_base  = next(d['throughput_mib_s'] for d in data if d['type'] == 'read' and not d['two_level_caching'])
-read_opt   = next(d['throughput_mib_s'] for d in data if d['type'] == 'read' and d['two_level_caching'])
+# One pass over the entries builds a keyed index; each category is then a
+# dict lookup instead of its own full scan of the list
+idx = {(d['type'], bool(d.get('delayed_reclamation')), bool(d.get('two_level_caching'))):
+       d['throughput_mib_s'] for d in data}
+write_base = idx[('write', False, False)]
+write_opt  = idx[('write', True, False)]
+read_base  = idx[('read', False, False)]
+read_opt   = idx[('read', False, True)]
 
 write_values = [write_base, write_opt]
 read_values = [read_base, read_opt]